@@ -13,15 +13,26 @@ Run as: systemd service (see smokeping-api.service)
 
 Usage:
     curl http://localhost:8080/
+    curl http://localhost:8080/?pretty=1
     curl http://localhost:8080/health
     curl http://localhost:8080/target/cloudflare
 
+Reading RRD files, in order of preference:
+    1. rrdcached, when SMOKEPING_API_RRDCACHED_SOCKET is set and reachable
+    2. rrdtool Python bindings, when installed (apt install python3-rrdtool)
+    3. rrdtool CLI
+
 Configuration via environment variables:
     SMOKEPING_API_BIND_ADDRESS - Address to bind to (default: 127.0.0.1)
     SMOKEPING_API_PORT         - Port to listen on (default: 8080)
     SMOKEPING_API_DATA_DIR     - Path to SmokePing RRD data (default: /var/lib/smokeping)
     SMOKEPING_API_TOTAL_PINGS  - Number of pings per probe cycle (default: 20)
     SMOKEPING_API_ISP          - ISP identifier (default: auto-detected from hostname)
+    SMOKEPING_API_RRDCACHED_SOCKET - rrdcached Unix socket, e.g. unix:/var/run/rrdcached.sock
+                                 (default: unset, read RRD files with the rrdtool CLI)
+    SMOKEPING_API_CACHE_TTL    - Seconds to reuse a target's last reading (default: 30, 0 = off)
+    SMOKEPING_API_PIN_NIC      - Network interface (e.g. eth0) whose NUMA node's CPUs the
+                                 server is pinned to (default: unset, no pinning)
 
 Security notes:
     - By default, binds to 127.0.0.1 (localhost only) for security
@@ -32,16 +43,36 @@ Security notes:
 
 from __future__ import annotations
 
+import functools
 import json
+import math
 import os
 import re
 import socket
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from statistics import median
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+# Optional rrdtool Python bindings (python3-rrdtool). When available, RRD files
+# are read in-process through librrd instead of running the rrdtool CLI.
+try:
+    import rrdtool
+except ImportError:
+    rrdtool = None
+
+# Optional orjson for faster JSON encoding; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
 
 # Type alias for RRD data response
 RRDData = dict[str, Any]
@@ -103,6 +134,11 @@ SMOKEPING_DATA_DIR: str = os.environ.get("SMOKEPING_API_DATA_DIR", "/var/lib/smo
 # Used to calculate packet loss percentage
 TOTAL_PINGS: int = _parse_int_env("SMOKEPING_API_TOTAL_PINGS", 20, min_val=1)
 
+# Seconds to reuse a target's last reading before reading the RRD file again.
+# SmokePing only writes new samples every probe cycle (60-300s), while Home
+# Assistant may poll much more often. Set to 0 to disable caching.
+CACHE_TTL: int = _parse_int_env("SMOKEPING_API_CACHE_TTL", 30, min_val=0)
+
 # Targets to expose (relative to SMOKEPING_DATA_DIR)
 # Format: "friendly_name": "path/to/file.rrd"
 # Find your RRD files with: find /var/lib/smokeping -name "*.rrd"
@@ -148,19 +184,45 @@ def detect_isp(hostname: str) -> str:
 # ISP can be set explicitly via environment variable, or auto-detected from hostname
 ISP: str = os.environ.get("SMOKEPING_API_ISP", detect_isp(HOSTNAME))
 
+# Optional rrdcached daemon socket. When set, RRD data is read over a persistent
+# Unix socket connection instead of spawning an rrdtool process per request.
+# Accepts "unix:/path/to/socket" or a plain absolute path.
+RRDCACHED_SOCKET: str = os.environ.get("SMOKEPING_API_RRDCACHED_SOCKET", "")
+
+# Optional network interface carrying Home Assistant traffic, e.g. "eth0". On
+# multi-socket/multi-chiplet machines the server is pinned to the CPUs of that
+# NIC's NUMA node, so request handling stays close to its interrupts.
+PIN_NIC: str = os.environ.get("SMOKEPING_API_PIN_NIC", "")
+
 # =============================================================================
 # API IMPLEMENTATION - No need to edit below this line
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=128)
+def _iso(timestamp: int) -> str:
+    """
+    Format a Unix timestamp as an ISO 8601 UTC string.
+
+    Cached because the same sample and request timestamps repeat across polls.
+
+    Args:
+        timestamp: Unix timestamp in whole seconds
+
+    Returns:
+        ISO 8601 string, e.g. "2025-01-02T17:50:00+00:00"
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
 def parse_rrd_lastupdate(output: str) -> RRDData:
     """
     Parse rrdtool lastupdate output.
 
     Example output:
-        uptime ping1 ping2 ... ping20 loss
+        uptime loss median ping1 ping2 ... ping20
 
-        1735840200: 123456 1.23e-02 1.45e-02 ... 0
+        1735840200: 123456 0 1.40e-02 1.23e-02 1.45e-02 ...
 
     Args:
         output: Raw output from rrdtool lastupdate command
@@ -204,56 +266,274 @@ def parse_rrd_lastupdate(output: str) -> RRDData:
     if len(values) < 2:
         return {"latency_ms": None, "loss_pct": None, "error": "Not enough values"}
 
-    # First value is uptime (ignore), last value is loss count
-    # Middle values are ping times in seconds (scientific notation)
-    # We want the median of the ping values
+    # The header line names the data sources in the same order as the values
+    ds_names = lines[0].split()
+    if len(ds_names) != len(values):
+        return {"latency_ms": None, "loss_pct": None, "error": "Header does not match values"}
 
-    ping_values: list[float] = []
-    for v in values[1:-1]:  # Skip uptime (first) and loss (last)
+    return _compute_metrics(timestamp, ds_names, values)
+
+
+def _ds_float(value: str | float | None) -> float | None:
+    """
+    Convert a data source value to a float.
+
+    Args:
+        value: Value as rrdtool text, a native float, or None
+
+    Returns:
+        The value as a float, or None if it is unknown ("U" or None)
+    """
+    if isinstance(value, str):
         try:
-            if v.lower() in ("u", "nan", "-nan"):
-                continue
-            val = float(v)
-            if val > 0:  # Valid ping time (positive only)
-                ping_values.append(val)
-        except (ValueError, TypeError):
-            continue
+            return float(value)
+        except ValueError:
+            return None  # "U" (unknown) or other non-numeric value
+    return value
+
+
+def _compute_metrics(
+    timestamp: int, ds_names: Iterable[str], values: Iterable[str | float | None]
+) -> RRDData:
+    """
+    Build the API result from one RRD sample.
+
+    Ping times and the loss count are picked by data source name, so the
+    result doesn't depend on the order SmokePing created the data sources in
+    (it writes "uptime loss median ping1 ... pingN").
+
+    Args:
+        timestamp: Unix timestamp of the sample
+        ds_names: Data source names, in the same order as values
+        values: Data source values as rrdtool text, native floats, or None
+
+    Returns:
+        Dict with latency_ms (median), loss_pct and timestamp
+    """
+    ping_values: list[float] = []
+    loss_count: int | None = None
+    for name, value in zip(ds_names, values):
+        if name.startswith("ping"):
+            ping = _ds_float(value)
+            if ping is not None and ping > 0:  # Positive only; also rejects NaN
+                ping_values.append(ping)
+        elif name == "loss":
+            # The loss count is normally a plain integer, so only go through
+            # float() for other spellings such as "2.0000000000e+00".
+            if isinstance(value, str) and value.isdigit():
+                loss_count = int(value)
+            else:
+                loss = _ds_float(value)
+                # Unknown, NaN and infinite loss values can't be converted to a count
+                if loss is not None and math.isfinite(loss):
+                    loss_count = int(loss)
 
-    # Calculate median latency in milliseconds using statistics.median
+    # Calculate median latency in milliseconds. Sorting ~20 floats in place is
+    # cheaper than statistics.median's generic numeric-type handling.
     latency_ms: float | None = None
     if ping_values:
-        latency_ms = round(median(ping_values) * 1000, 2)
-
-    # Parse loss count (last value) and calculate percentage
+        ping_values.sort()
+        mid = len(ping_values) // 2
+        if len(ping_values) % 2:
+            median = ping_values[mid]
+        else:
+            median = (ping_values[mid - 1] + ping_values[mid]) * 0.5
+        latency_ms = round(median * 1000, 2)
+
+    # Calculate loss percentage
     # Guard against TOTAL_PINGS=0 (should not happen due to validation, but be safe)
     loss_pct: float | None = None
-    if TOTAL_PINGS > 0:
-        try:
-            loss_count = int(float(values[-1]))
-            loss_pct = round((loss_count / TOTAL_PINGS) * 100, 1)
-            # Cap at 100% in case loss_count exceeds TOTAL_PINGS
-            if loss_pct > 100.0:
-                loss_pct = 100.0
-        except (ValueError, TypeError, IndexError):
-            pass
+    if loss_count is not None and TOTAL_PINGS > 0:
+        loss_pct = round((loss_count / TOTAL_PINGS) * 100, 1)
+        # Cap at 100% in case loss_count exceeds TOTAL_PINGS
+        if loss_pct > 100.0:
+            loss_pct = 100.0
 
     return {
         "latency_ms": latency_ms,
         "loss_pct": loss_pct,
-        "timestamp": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+        "timestamp": _iso(timestamp),
     }
 
 
-def get_target_data(target_name: str, rrd_path: str) -> RRDData:
+def _bindings_lastupdate(real_path: str) -> RRDData:
     """
-    Read RRD file and return parsed data.
+    Read the last update of an RRD file with the rrdtool Python bindings.
+
+    The bindings return native values keyed by data source name, so no text
+    parsing is needed.
+
+    Args:
+        real_path: Absolute path to the RRD file
+
+    Returns:
+        Dict with latency_ms (median), loss_pct and timestamp
+    """
+    info = rrdtool.lastupdate(real_path)
+    ds_values: dict[str, float | None] = info["ds"]
+
+    # "date" is a naive local datetime; timestamp() converts it back to epoch time
+    return _compute_metrics(int(info["date"].timestamp()), ds_values.keys(), ds_values.values())
+
+
+# Timeout in seconds for a single RRD read (rrdtool process or rrdcached command)
+_RRD_TIMEOUT = 5
+
+# One rrdcached connection per thread; the protocol is strictly request/response
+# so a connection can't be shared between concurrent handlers.
+_rrdcached_local = threading.local()
+
+
+def _rrdcached_connect() -> tuple[socket.socket, Any] | None:
+    """
+    Return this thread's rrdcached connection, opening it on first use.
+
+    Returns:
+        Tuple of (socket, binary reader), or None if the daemon is unreachable
+    """
+    conn: tuple[socket.socket, Any] | None = getattr(_rrdcached_local, "conn", None)
+    if conn is not None:
+        return conn
+
+    address = RRDCACHED_SOCKET
+    if address.startswith("unix:"):
+        address = address[len("unix:") :]
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(_RRD_TIMEOUT)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        return None
+
+    conn = (sock, sock.makefile("rb"))
+    _rrdcached_local.conn = conn
+    return conn
+
+
+def _rrdcached_close() -> None:
+    """Drop this thread's rrdcached connection so the next call reconnects."""
+    conn = getattr(_rrdcached_local, "conn", None)
+    _rrdcached_local.conn = None
+    if conn is not None:
+        sock, reader = conn
+        reader.close()
+        sock.close()
+
+
+def _rrdcached_reply(reader: Any) -> list[str] | None:
+    """
+    Read one reply from rrdcached.
+
+    Replies start with a status line "<N> <message>". A negative N is an error,
+    otherwise N data lines follow.
+
+    Args:
+        reader: Binary reader of the connection returned by _rrdcached_connect()
+
+    Returns:
+        The data lines of the reply, or None if the daemon rejected the command
+
+    Raises:
+        ConnectionError: The daemon closed the connection
+    """
+    status = reader.readline().decode()
+    if not status:
+        raise ConnectionError("rrdcached closed the connection")
+
+    count = int(status.partition(" ")[0])
+    if count < 0:
+        return None
+
+    return [reader.readline().decode().rstrip("\n") for _ in range(count)]
+
+
+def _info_metrics(lines: list[str]) -> RRDData:
+    """
+    Build the API result from an rrdcached INFO reply.
+
+    rrdcached has no LASTUPDATE command, but INFO reports the same data as
+    "last_update <type> <timestamp>" and "ds[<name>].last_ds <type> <value>"
+    lines.
+
+    Args:
+        lines: Data lines from an INFO reply
+
+    Returns:
+        Dict with latency_ms (median), loss_pct, timestamp, and optionally error
+    """
+    timestamp: int | None = None
+    ds_names: list[str] = []
+    ds_values: list[str] = []
+    for line in lines:
+        key, _, rest = line.partition(" ")
+        value = rest.partition(" ")[2].strip().strip('"')
+        if key == "last_update":
+            try:
+                timestamp = int(value)
+            except ValueError:
+                break
+        elif key.startswith("ds[") and key.endswith("].last_ds"):
+            ds_names.append(key[len("ds[") : -len("].last_ds")])
+            ds_values.append(value or "U")
+
+    if timestamp is None:
+        return {"latency_ms": None, "loss_pct": None, "error": "Invalid timestamp"}
+
+    return _compute_metrics(timestamp, ds_names, ds_values)
+
+
+def _rrdcached_read(real_paths: list[str]) -> list[RRDData] | None:
+    """
+    Read the last update of several RRD files through rrdcached.
+
+    Each file is flushed first so values still queued in the daemon are
+    included. All commands are written at once and the replies read back in
+    order, so any number of files costs a single round trip. (BATCH mode
+    can't be used: it only reports errors, not INFO output.)
+
+    Args:
+        real_paths: Absolute paths to the RRD files
+
+    Returns:
+        One result dict per path, in order, or None if rrdcached is unreachable
+    """
+    conn = _rrdcached_connect()
+    if conn is None:
+        return None
+    sock, reader = conn
+
+    results: list[RRDData] = []
+    try:
+        sock.sendall("".join(f"FLUSH {path}\nINFO {path}\n" for path in real_paths).encode())
+        for _ in real_paths:
+            # Always read both replies so the connection stays in sync
+            flush_reply = _rrdcached_reply(reader)
+            info_reply = _rrdcached_reply(reader)
+            if flush_reply is None or info_reply is None:
+                results.append(
+                    {"latency_ms": None, "loss_pct": None, "error": "rrdcached error reading file"}
+                )
+            else:
+                results.append(_info_metrics(info_reply))
+    except (OSError, ValueError):
+        # Broken or desynchronised connection (e.g. daemon restarted)
+        _rrdcached_close()
+        return None
+
+    return results
+
+
+def _resolve_rrd_path(rrd_path: str) -> str | None:
+    """
+    Resolve an RRD path and check that it stays inside SMOKEPING_DATA_DIR.
 
     Args:
-        target_name: Friendly name of the target (for logging)
         rrd_path: Relative path to RRD file within SMOKEPING_DATA_DIR
 
     Returns:
-        Dict with latency_ms, loss_pct, timestamp, and optionally error
+        Absolute path with symlinks resolved, or None if it escapes the data directory
     """
     full_path = os.path.join(SMOKEPING_DATA_DIR, rrd_path)
 
@@ -262,25 +542,162 @@ def get_target_data(target_name: str, rrd_path: str) -> RRDData:
     real_path = os.path.realpath(full_path)
     base_path = os.path.realpath(SMOKEPING_DATA_DIR)
     if not real_path.startswith(base_path + os.sep) and real_path != base_path:
-        return {
-            "latency_ms": None,
-            "loss_pct": None,
-            "error": "Invalid path",
-        }
-
-    if not os.path.exists(real_path):
-        return {
-            "latency_ms": None,
-            "loss_pct": None,
-            "error": f"RRD file not found: {rrd_path}",
-        }
+        return None
+    return real_path
+
+
+def _resolve_targets(targets: dict[str, str]) -> dict[str, str]:
+    """
+    Resolve the RRD paths of all targets once, skipping invalid ones.
+
+    Args:
+        targets: Mapping of friendly name to relative RRD path
+
+    Returns:
+        Dict mapping relative RRD path to resolved absolute path
+    """
+    resolved: dict[str, str] = {}
+    for target_name, rrd_path in targets.items():
+        real_path = _resolve_rrd_path(rrd_path)
+        if real_path is None:
+            print(
+                f"Warning: target {target_name} path '{rrd_path}' is outside "
+                f"{SMOKEPING_DATA_DIR}, it will report an error",
+                file=sys.stderr,
+            )
+            continue
+        resolved[rrd_path] = real_path
+    return resolved
+
+
+# Resolved once at startup so requests don't walk the filesystem with realpath
+_RESOLVED: dict[str, str] = _resolve_targets(TARGETS)
+
+# Successful readings keyed by relative RRD path:
+# (time.monotonic() when last checked, RRD file mtime, data, data encoded as JSON)
+_CACHE: dict[str, tuple[float, float, RRDData, bytes]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def get_target_data(target_name: str, rrd_path: str) -> RRDData:
+    """
+    Read RRD file and return parsed data.
+
+    Successful readings are reused for CACHE_TTL seconds, and after that for as
+    long as the RRD file's mtime is unchanged. Errors are never cached.
+
+    Args:
+        target_name: Friendly name of the target (for logging)
+        rrd_path: Relative path to RRD file within SMOKEPING_DATA_DIR
+
+    Returns:
+        Dict with latency_ms, loss_pct, timestamp, and optionally error
+    """
+    now = time.monotonic()
+    result, real_path, mtime = _check_target(rrd_path, now)
+    if result is not None:
+        return result
+    return _store_reading(rrd_path, now, mtime, _read_rrd(real_path))
+
 
+def _check_target(rrd_path: str, now: float) -> tuple[RRDData | None, str, float]:
+    """
+    Answer a read from the cache or with a path error if possible.
+
+    Args:
+        rrd_path: Relative path to RRD file within SMOKEPING_DATA_DIR
+        now: Current time.monotonic()
+
+    Returns:
+        Tuple of (result, real_path, mtime). If result is None the file must be
+        read, and its reading passed to _store_reading() with the same mtime.
+    """
+    with _CACHE_LOCK:
+        cached = _CACHE.get(rrd_path)
+    if cached is not None and now - cached[0] < CACHE_TTL:
+        # Copy so callers can add fields without touching the cached entry
+        return dict(cached[2]), "", 0.0
+
+    # Configured targets were resolved and validated at startup
+    real_path = _RESOLVED.get(rrd_path) or _resolve_rrd_path(rrd_path)
+    if real_path is None:
+        return {"latency_ms": None, "loss_pct": None, "error": "Invalid path"}, "", 0.0
+
+    try:
+        mtime = os.stat(real_path).st_mtime
+    except OSError:
+        return (
+            {"latency_ms": None, "loss_pct": None, "error": f"RRD file not found: {rrd_path}"},
+            "",
+            0.0,
+        )
+
+    # SmokePing hasn't written a new sample: one stat() instead of a full read.
+    # Not with rrdcached, which holds updates in memory so the mtime lags behind.
+    if cached is not None and cached[1] == mtime and not RRDCACHED_SOCKET:
+        return _store_reading(rrd_path, now, mtime, cached[2], cached[3]), real_path, mtime
+
+    return None, real_path, mtime
+
+
+def _store_reading(
+    rrd_path: str, now: float, mtime: float, result: RRDData, encoded: bytes | None = None
+) -> RRDData:
+    """
+    Cache a successful reading along with its JSON encoding.
+
+    Args:
+        rrd_path: Relative path to RRD file within SMOKEPING_DATA_DIR
+        now: time.monotonic() when the read started
+        mtime: RRD file mtime from _check_target()
+        result: The reading
+        encoded: result already encoded as JSON, if known
+
+    Returns:
+        A copy of result for the caller
+    """
+    if "error" not in result and CACHE_TTL > 0:
+        if encoded is None:
+            encoded = _dumps(result)
+        with _CACHE_LOCK:
+            _CACHE[rrd_path] = (now, mtime, result, encoded)
+    return dict(result)
+
+
+def _read_rrd(real_path: str, use_rrdcached: bool = True) -> RRDData:
+    """
+    Read the last update of an RRD file without caching.
+
+    Args:
+        real_path: Absolute path to an existing RRD file
+        use_rrdcached: Try rrdcached first if RRDCACHED_SOCKET is set
+
+    Returns:
+        Dict with latency_ms, loss_pct, timestamp, and optionally error
+    """
     try:
+        if RRDCACHED_SOCKET and use_rrdcached:
+            rrdcached_results = _rrdcached_read([real_path])
+            if rrdcached_results is not None:
+                return rrdcached_results[0]
+
+        if rrdtool is not None:
+            try:
+                return _bindings_lastupdate(real_path)
+            except rrdtool.OperationalError:
+                # SECURITY: Don't leak librrd error details
+                return {
+                    "latency_ms": None,
+                    "loss_pct": None,
+                    "error": "rrdtool error reading file",
+                }
+
+        # No rrdcached or bindings available: fall back to the rrdtool CLI
         result = subprocess.run(
             ["rrdtool", "lastupdate", real_path],
             capture_output=True,
             text=True,
-            timeout=5,
+            timeout=_RRD_TIMEOUT,
         )
 
         if result.returncode != 0:
@@ -302,9 +719,202 @@ def get_target_data(target_name: str, rrd_path: str) -> RRDData:
         return {"latency_ms": None, "loss_pct": None, "error": "Unexpected error reading RRD file"}
 
 
+# Reusable stdlib encoders. json.dumps() with non-default options builds a new
+# JSONEncoder on every call.
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_PRETTY_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable object
+        pretty: Indent with 2 spaces instead of producing compact output
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        body: bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+        return body
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    return encoder.encode(data).encode()
+
+
+# Constant response parts, encoded once at startup
+_HEALTH: dict[str, Any] = {"status": "ok", "hostname": HOSTNAME, "isp": ISP}
+_HEALTH_JSON = _dumps(_HEALTH)
+# The fixed middle of the / response, from after "targets" up to "collected_at"
+_ROOT_JSON_MIDDLE = b"," + _dumps({"isp": ISP, "hostname": HOSTNAME})[1:-1] + b',"collected_at":'
+
+# Route for the single-target endpoint: /target/<name>
+_TARGET_RE = re.compile(r"^/target/([\w-]+)$")
+
+# Worker pool for all RRD reads. Targets on the aggregate endpoint are read
+# concurrently, so N targets take about as long as the slowest one. Handler
+# threads come and go with client connections; the pool's long-lived threads
+# keep their rrdcached connections open across requests.
+_EXECUTOR = ThreadPoolExecutor(max_workers=max(len(TARGETS), 1), thread_name_prefix="rrd-reader")
+
+
+def _read_targets(targets: dict[str, str]) -> dict[str, RRDData]:
+    """
+    Read the given targets, reading cache misses concurrently on the worker pool.
+
+    The cache is checked on the calling thread, so cached readings are served
+    without waiting for a free pool thread behind slow reads. With rrdcached,
+    the misses are read in one pipelined exchange instead; if that fails, they
+    are read on the worker pool without rrdcached rather than retrying the
+    daemon once per target.
+
+    Args:
+        targets: Mapping of friendly name to relative RRD path
+
+    Returns:
+        Dict mapping target name to its get_target_data() result
+    """
+    now = time.monotonic()
+    results: dict[str, RRDData] = {}
+    pending: dict[str, tuple[str, str, float]] = {}
+    for target_name, rrd_path in targets.items():
+        result, real_path, mtime = _check_target(rrd_path, now)
+        if result is not None:
+            results[target_name] = result
+        else:
+            pending[target_name] = (rrd_path, real_path, mtime)
+
+    if pending:
+        # One deadline for the whole request, slightly above _RRD_TIMEOUT so the
+        # reads' own timeouts fire first. A fallback after a failed pipelined
+        # exchange gets only what is left of it.
+        deadline = time.monotonic() + _RRD_TIMEOUT + 1
+        readings: list[RRDData] | None = None
+        if RRDCACHED_SOCKET:
+            readings = _read_pipelined(
+                [real_path for _, real_path, _ in pending.values()], deadline
+            )
+
+        if readings is None:
+            fallback = _gather(
+                {
+                    target_name: _EXECUTOR.submit(_read_rrd, real_path, False)
+                    for target_name, (_, real_path, _) in pending.items()
+                },
+                deadline,
+            )
+            readings = list(fallback.values())
+
+        for (target_name, (rrd_path, _, mtime)), reading in zip(pending.items(), readings):
+            results[target_name] = _store_reading(rrd_path, now, mtime, reading)
+
+    # Keep the requested target order
+    return {target_name: results[target_name] for target_name in targets}
+
+
+def _read_pipelined(real_paths: list[str], deadline: float) -> list[RRDData] | None:
+    """
+    Read RRD files with one pipelined rrdcached exchange on the worker pool.
+
+    Args:
+        real_paths: Absolute paths to the RRD files
+        deadline: time.monotonic() by which the exchange must finish
+
+    Returns:
+        One result dict per path, in order, or None if rrdcached is unreachable
+    """
+    pipelined = _EXECUTOR.submit(_rrdcached_read, real_paths)
+    try:
+        return pipelined.result(timeout=max(deadline - time.monotonic(), 0))
+    except FutureTimeoutError:
+        pipelined.cancel()
+        return [_timeout_result() for _ in real_paths]
+
+
+def _gather(futures: dict[str, Future[RRDData]], deadline: float) -> dict[str, RRDData]:
+    """
+    Collect pooled reads, giving up on any that miss the deadline.
+
+    Args:
+        futures: Mapping of target name to its pending read
+        deadline: time.monotonic() by which the reads must finish
+
+    Returns:
+        Dict mapping target name to its result, in the order of futures
+    """
+    wait(futures.values(), timeout=max(deadline - time.monotonic(), 0))
+
+    results: dict[str, RRDData] = {}
+    for target_name, future in futures.items():
+        if future.done():
+            results[target_name] = future.result()
+        else:
+            # Drop reads still queued behind a busy pool; the client has given up on them
+            future.cancel()
+            results[target_name] = _timeout_result()
+    return results
+
+
+def _timeout_result() -> RRDData:
+    """Result for a read that didn't finish in time."""
+    return {"latency_ms": None, "loss_pct": None, "error": "rrdtool timeout"}
+
+
+def get_all_target_data() -> dict[str, RRDData]:
+    """
+    Read every configured target concurrently.
+
+    Returns:
+        Dict mapping target name to its get_target_data() result
+    """
+    return _read_targets(TARGETS)
+
+
+# Encoded '"name":' prefixes for the targets object
+_TARGET_KEYS_JSON: dict[str, bytes] = {name: _dumps(name) + b":" for name in TARGETS}
+
+
+def get_all_target_json() -> bytes:
+    """
+    Read every configured target and encode them as one compact JSON object.
+
+    Readings served from the cache reuse the encoding stored with them, so on
+    cache hits this is mostly bytes concatenation.
+
+    Returns:
+        Encoded object mapping target name to its get_target_data() result
+    """
+    results = get_all_target_data()
+
+    parts: list[bytes] = []
+    for target_name, result in results.items():
+        with _CACHE_LOCK:
+            cached = _CACHE.get(TARGETS[target_name])
+        # The cache may have moved on since the read; only reuse a matching entry
+        encoded = cached[3] if cached is not None and cached[2] == result else _dumps(result)
+        parts.append(_TARGET_KEYS_JSON[target_name] + encoded)
+    return b"{" + b",".join(parts) + b"}"
+
+
 class SmokePingAPIHandler(BaseHTTPRequestHandler):
     """HTTP request handler for SmokePing API."""
 
+    # Keep connections open between polls; every response with a body sends
+    # Content-Length (a 204 never has one and must not send the header)
+    protocol_version = "HTTP/1.1"
+
+    # Close kept-alive connections that stay idle this long (seconds), so idle
+    # or half-open clients don't each hold a socket and handler thread forever
+    timeout = 60
+
+    # Buffer writes so headers and body leave in one send() per response; the
+    # server flushes after each request. With the separate header and body
+    # writes of an unbuffered stream, Nagle's algorithm can also hold the body
+    # back on a kept-alive connection, so disable it too.
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
     def log_message(self, fmt: str, *args: Any) -> None:
         """Suppress default logging (too noisy for systemd)."""
         pass
@@ -318,13 +928,18 @@ class SmokePingAPIHandler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
 
-    def send_json(self, data: dict[str, Any], status: int = 200) -> None:
-        """Send JSON response with CORS headers."""
+    def send_json(self, data: dict[str, Any], status: int = 200, pretty: bool = False) -> None:
+        """Send JSON response with CORS headers (indented if pretty)."""
+        self.send_json_bytes(_dumps(data, pretty=pretty), status)
+
+    def send_json_bytes(self, body: bytes, status: int = 200) -> None:
+        """Send already encoded JSON response with CORS headers."""
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self._send_cors_headers()
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
 
     def do_OPTIONS(self) -> None:
         """Handle CORS preflight requests."""
@@ -334,34 +949,48 @@ class SmokePingAPIHandler(BaseHTTPRequestHandler):
 
     def do_GET(self) -> None:
         """Handle GET requests."""
-        if self.path == "/health":
-            self.send_json({"status": "ok", "hostname": HOSTNAME, "isp": ISP})
+        url = urlsplit(self.path)
+        path = url.path
+
+        # Indented JSON on request with ?pretty=1
+        pretty = parse_qs(url.query).get("pretty") == ["1"]
+
+        if path == "/health":
+            if pretty:
+                self.send_json(_HEALTH, pretty=True)
+            else:
+                self.send_json_bytes(_HEALTH_JSON)
             return
 
-        if self.path in ("/", "/metrics"):
-            # Collect all target data
-            results: dict[str, RRDData] = {}
-            for target_name, rrd_path in TARGETS.items():
-                results[target_name] = get_target_data(target_name, rrd_path)
-
-            response: dict[str, Any] = {
-                "targets": results,
-                "isp": ISP,
-                "hostname": HOSTNAME,
-                "collected_at": datetime.now(timezone.utc).isoformat(),
-            }
-            self.send_json(response)
+        if path in ("/", "/metrics"):
+            if pretty:
+                response: dict[str, Any] = {
+                    "targets": get_all_target_data(),
+                    "isp": ISP,
+                    "hostname": HOSTNAME,
+                    "collected_at": _iso(int(time.time())),
+                }
+                self.send_json(response, pretty=True)
+            else:
+                # Splice the dynamic parts around the pre-encoded constant fields
+                self.send_json_bytes(
+                    b'{"targets":'
+                    + get_all_target_json()
+                    + _ROOT_JSON_MIDDLE
+                    + _dumps(_iso(int(time.time())))
+                    + b"}"
+                )
             return
 
         # Single target endpoint: /target/<name>
-        match = re.match(r"^/target/([\w-]+)$", self.path)
+        match = _TARGET_RE.match(path)
         if match:
             target_name = match.group(1)
             if target_name in TARGETS:
-                data = get_target_data(target_name, TARGETS[target_name])
+                data = _read_targets({target_name: TARGETS[target_name]})[target_name]
                 data["target"] = target_name
                 data["isp"] = ISP
-                self.send_json(data)
+                self.send_json(data, pretty=pretty)
             else:
                 self.send_json(
                     {
@@ -369,6 +998,7 @@ class SmokePingAPIHandler(BaseHTTPRequestHandler):
                         "available": list(TARGETS.keys()),
                     },
                     status=404,
+                    pretty=pretty,
                 )
             return
 
@@ -376,12 +1006,84 @@ class SmokePingAPIHandler(BaseHTTPRequestHandler):
         self.send_json(
             {"error": "Not found", "endpoints": ["/", "/health", "/target/<name>"]},
             status=404,
+            pretty=pretty,
+        )
+
+
+def _parse_cpulist(cpulist: str) -> set[int]:
+    """
+    Parse a Linux CPU list such as "0-3,8-11".
+
+    Args:
+        cpulist: Comma-separated CPU numbers and ranges
+
+    Returns:
+        Set of CPU numbers
+    """
+    cpus: set[int] = set()
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _nic_cpus(interface: str, sysfs: str = "/sys") -> set[int]:
+    """
+    Find the CPUs on the NUMA node a network interface is attached to.
+
+    Args:
+        interface: Network interface name, e.g. "eth0"
+        sysfs: sysfs mount point
+
+    Returns:
+        Set of CPU numbers, empty if unknown (no such interface, virtual
+        interface, or a machine without NUMA information)
+    """
+    if not interface or "/" in interface or interface in (".", ".."):
+        return set()
+
+    try:
+        with open(os.path.join(sysfs, "class/net", interface, "device/numa_node")) as f:
+            node = int(f.read())
+        if node < 0:
+            return set()
+        with open(os.path.join(sysfs, f"devices/system/node/node{node}/cpulist")) as f:
+            return _parse_cpulist(f.read())
+    except (OSError, ValueError):
+        return set()
+
+
+def _pin_to_nic(interface: str) -> None:
+    """
+    Pin the process to the CPUs local to a network interface.
+
+    Must run before worker threads start; they inherit the main thread's affinity.
+
+    Args:
+        interface: Network interface name, e.g. "eth0"
+    """
+    cpus = _nic_cpus(interface) & os.sched_getaffinity(0)
+    if not cpus:
+        print(
+            f"Warning: no NUMA CPU information for interface {interface}, not pinning",
+            file=sys.stderr,
         )
+        return
+
+    os.sched_setaffinity(0, cpus)
+    print(f"Pinned to CPUs {sorted(cpus)} (NUMA node of {interface})")
 
 
 def main() -> None:
     """Start the HTTP server."""
-    server = HTTPServer((BIND_ADDRESS, PORT), SmokePingAPIHandler)
+    if PIN_NIC:
+        _pin_to_nic(PIN_NIC)
+
+    # One thread per connection so a slow RRD read doesn't block other clients.
+    # ThreadingHTTPServer uses daemon threads, so shutdown isn't held up by them.
+    server = ThreadingHTTPServer((BIND_ADDRESS, PORT), SmokePingAPIHandler)
     print(f"SmokePing API starting on {BIND_ADDRESS}:{PORT}")
     print(f"Hostname: {HOSTNAME}, ISP: {ISP}")
     print(f"Data directory: {SMOKEPING_DATA_DIR}")
@@ -5,13 +5,19 @@ These tests cover:
 - RRD output parsing (parse_rrd_lastupdate)
 - ISP detection (detect_isp)
 - Target data retrieval with path validation (get_target_data)
+- rrdcached socket client
+- rrdtool Python bindings
+- Reading cache (CACHE_TTL)
+- Concurrent retrieval of all targets (get_all_target_data)
 - HTTP handler endpoints
 """
 
 import json
 import os
 import sys
+import time
 from io import BytesIO
+from pathlib import Path
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
 
@@ -21,6 +27,22 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "api"))
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """Start every test with an empty reading cache."""
+    import smokeping_api
+
+    smokeping_api._CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_rrdtool_bindings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Exercise the rrdtool CLI path even where python3-rrdtool is installed."""
+    import smokeping_api
+
+    monkeypatch.setattr(smokeping_api, "rrdtool", None)
+
+
 class TestParseRrdLastupdate:
     """Tests for parse_rrd_lastupdate function."""
 
@@ -41,7 +63,7 @@ class TestParseRrdLastupdate:
         assert result["latency_ms"] == 14.0
         assert result["loss_pct"] == 0.0
         assert "error" not in result
-        assert "timestamp" in result
+        assert result["timestamp"] == "2025-01-02T17:50:00+00:00"
 
     def test_empty_output(self) -> None:
         """Test parsing empty output returns error."""
@@ -179,6 +201,30 @@ not_a_number: 123456 1.50e-02 0"""
         assert "error" in result
         assert "timestamp" in result["error"].lower()
 
+    def test_loss_in_scientific_notation(self) -> None:
+        """Test that a non-integer loss representation is still parsed."""
+        from smokeping_api import parse_rrd_lastupdate
+
+        output = """uptime ping1 loss
+
+1735840200: 123456 1.50e-02 5.0000000000e+00"""
+
+        result = parse_rrd_lastupdate(output)
+
+        assert result["loss_pct"] == 25.0
+
+    def test_unknown_loss(self) -> None:
+        """Test that an unknown or NaN loss value gives loss_pct None."""
+        from smokeping_api import parse_rrd_lastupdate
+
+        for loss in ("U", "nan"):
+            result = parse_rrd_lastupdate(
+                f"uptime ping1 loss\n\n1735840200: 123456 1.50e-02 {loss}"
+            )
+
+            assert result["latency_ms"] == 15.0
+            assert result["loss_pct"] is None
+
     def test_loss_exceeds_total_pings_capped(self) -> None:
         """Test that loss percentage is capped at 100%."""
         from smokeping_api import parse_rrd_lastupdate
@@ -235,7 +281,7 @@ class TestGetTargetData:
 1735840200: 123456 1.50e-02 0"""
 
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run") as mock_run,
         ):
@@ -263,13 +309,38 @@ class TestGetTargetData:
             assert "error" in result
             assert "Invalid path" in result["error"]
 
+    def test_configured_targets_resolved_at_startup(self) -> None:
+        """Test configured targets don't resolve their path on every read."""
+        from smokeping_api import TARGETS, get_target_data
+
+        with (
+            patch("smokeping_api.os.path.realpath", side_effect=AssertionError),
+            patch("smokeping_api.os.stat", side_effect=FileNotFoundError),
+        ):
+            result = get_target_data("cloudflare", TARGETS["cloudflare"])
+
+            assert "not found" in result["error"]
+
+    def test_resolve_targets_skips_invalid_paths(self) -> None:
+        """Test startup resolution drops paths outside the data directory."""
+        from io import StringIO
+
+        from smokeping_api import SMOKEPING_DATA_DIR, _resolve_targets
+
+        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
+            resolved = _resolve_targets({"good": "external/good.rrd", "evil": "../../etc/passwd"})
+
+        base = os.path.realpath(SMOKEPING_DATA_DIR)
+        assert resolved == {"external/good.rrd": os.path.join(base, "external", "good.rrd")}
+        assert "evil" in mock_stderr.getvalue()
+
     def test_nonexistent_file_returns_error(self) -> None:
         """Test that non-existent file returns appropriate error."""
         from smokeping_api import get_target_data
 
         with (
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
-            patch("smokeping_api.os.path.exists", return_value=False),
+            patch("smokeping_api.os.stat", side_effect=FileNotFoundError),
         ):
             result = get_target_data("missing", "nonexistent.rrd")
 
@@ -282,7 +353,7 @@ class TestGetTargetData:
         from smokeping_api import get_target_data
 
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run", side_effect=FileNotFoundError),
         ):
@@ -299,7 +370,7 @@ class TestGetTargetData:
         from smokeping_api import get_target_data
 
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 5)),
         ):
@@ -314,7 +385,7 @@ class TestGetTargetData:
         from smokeping_api import get_target_data
 
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run") as mock_run,
         ):
@@ -332,7 +403,7 @@ class TestGetTargetData:
         from smokeping_api import get_target_data
 
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run", side_effect=RuntimeError("Unexpected")),
         ):
@@ -344,6 +415,610 @@ class TestGetTargetData:
             assert "Unexpected error" in result["error"]
 
 
+class TestReadingCache:
+    """Tests for caching of target readings."""
+
+    MOCK_OUTPUT = "uptime ping1 loss\n\n1735840200: 123456 1.50e-02 0"
+
+    def test_reading_reused_within_ttl(self) -> None:
+        """Test that a second read within the TTL doesn't run rrdtool."""
+        from smokeping_api import get_target_data
+
+        with (
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout=self.MOCK_OUTPUT, stderr="")
+
+            first = get_target_data("test", "valid.rrd")
+            first["target"] = "test"  # Callers may add fields to the result
+            second = get_target_data("test", "valid.rrd")
+
+            assert mock_run.call_count == 1
+            assert second["latency_ms"] == 15.0
+            assert "target" not in second
+
+    def test_reading_expires_after_ttl(self) -> None:
+        """Test that rrdtool runs again once the TTL has passed and the file changed."""
+        from smokeping_api import get_target_data
+
+        with (
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.time.monotonic", side_effect=[1000.0, 1031.0]),
+            patch(
+                "smokeping_api.os.stat",
+                side_effect=[MagicMock(st_mtime=1735840200.0), MagicMock(st_mtime=1735840500.0)],
+            ),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout=self.MOCK_OUTPUT, stderr="")
+
+            get_target_data("test", "valid.rrd")
+            get_target_data("test", "valid.rrd")
+
+            assert mock_run.call_count == 2
+
+    def test_unchanged_file_reused_after_ttl(self) -> None:
+        """Test that an expired reading is reused while the file mtime is unchanged."""
+        from smokeping_api import get_target_data
+
+        with (
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.time.monotonic", side_effect=[1000.0, 1031.0, 1045.0]),
+            patch(
+                "smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)
+            ) as mock_stat,
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout=self.MOCK_OUTPUT, stderr="")
+
+            get_target_data("test", "valid.rrd")
+            second = get_target_data("test", "valid.rrd")
+            # The mtime check restarted the TTL, so this is served without a stat()
+            get_target_data("test", "valid.rrd")
+
+            assert mock_run.call_count == 1
+            assert mock_stat.call_count == 2
+            assert second["latency_ms"] == 15.0
+
+    def test_mtime_ignored_with_rrdcached(self) -> None:
+        """Test that rrdcached readings are refreshed even if the mtime is unchanged."""
+        from smokeping_api import get_target_data, parse_rrd_lastupdate
+
+        with (
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.RRDCACHED_SOCKET", "/run/rrdcached.sock"),
+            patch(
+                "smokeping_api._rrdcached_read",
+                side_effect=lambda paths: [parse_rrd_lastupdate(self.MOCK_OUTPUT) for _ in paths],
+            ) as mock_read,
+            patch("smokeping_api.time.monotonic", side_effect=[1000.0, 1031.0]),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+        ):
+            get_target_data("test", "valid.rrd")
+            get_target_data("test", "valid.rrd")
+
+            assert mock_read.call_count == 2
+
+    def test_errors_not_cached(self) -> None:
+        """Test that failed reads are retried on the next request."""
+        from smokeping_api import get_target_data
+
+        with (
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="error")
+            assert "error" in get_target_data("test", "valid.rrd")
+
+            mock_run.return_value = MagicMock(returncode=0, stdout=self.MOCK_OUTPUT, stderr="")
+            assert get_target_data("test", "valid.rrd")["latency_ms"] == 15.0
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        """Test that CACHE_TTL=0 reads the RRD file on every request."""
+        from smokeping_api import get_target_data
+
+        with (
+            patch("smokeping_api.CACHE_TTL", 0),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout=self.MOCK_OUTPUT, stderr="")
+
+            get_target_data("test", "valid.rrd")
+            get_target_data("test", "valid.rrd")
+
+            assert mock_run.call_count == 2
+
+
+class TestRRDCached:
+    """Tests for reading RRD data through rrdcached."""
+
+    INFO_REPLY = (
+        b"0 Flushed /data/valid.rrd\n"
+        b"7 Info for /data/valid.rrd follows\n"
+        b"filename 2 /data/valid.rrd\n"
+        b"last_update 1 1735840200\n"
+        b"ds[uptime].last_ds 2 123456\n"
+        b"ds[ping1].last_ds 2 1.00e-02\n"
+        b"ds[ping2].last_ds 2 U\n"
+        b"ds[ping3].last_ds 2 2.00e-02\n"
+        b"ds[loss].last_ds 2 5\n"
+    )
+
+    def test_info_metrics(self) -> None:
+        """Test INFO reply lines are turned into a result by data source name."""
+        from smokeping_api import _info_metrics
+
+        result = _info_metrics(
+            [
+                "filename 2 /data/valid.rrd",
+                "last_update 1 1735840200",
+                "ds[uptime].last_ds 2 123456",
+                "ds[uptime].min 0 NaN",
+                "ds[loss].last_ds 2 0",
+                "ds[ping1].last_ds 2 1.50e-02",
+            ]
+        )
+
+        assert result == {
+            "latency_ms": 15.0,
+            "loss_pct": 0.0,
+            "timestamp": "2025-01-02T17:50:00+00:00",
+        }
+
+    def test_info_without_last_update(self) -> None:
+        """Test an INFO reply without a usable last_update is reported as an error."""
+        from smokeping_api import _info_metrics
+
+        result = _info_metrics(["ds[ping1].last_ds 2 1.50e-02"])
+
+        assert result["latency_ms"] is None
+        assert "error" in result
+
+    def test_reads_through_socket(self) -> None:
+        """Test data is read from rrdcached without spawning rrdtool."""
+        from smokeping_api import get_target_data
+
+        sock = MagicMock()
+        with (
+            patch("smokeping_api.RRDCACHED_SOCKET", "unix:/run/rrdcached.sock"),
+            patch(
+                "smokeping_api._rrdcached_connect", return_value=(sock, BytesIO(self.INFO_REPLY))
+            ),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            result = get_target_data("test", "valid.rrd")
+
+            mock_run.assert_not_called()
+            sent = b"".join(call.args[0] for call in sock.sendall.call_args_list)
+            assert sent.startswith(b"FLUSH ")
+            assert b"\nINFO " in sent
+            assert result["latency_ms"] == 15.0
+            assert result["loss_pct"] == 25.0
+
+    def test_error_status_returns_error(self) -> None:
+        """Test a negative rrdcached status is reported as an error."""
+        from smokeping_api import get_target_data
+
+        reply = BytesIO(b"-1 No such file: /data/valid.rrd\n" * 2)
+        with (
+            patch("smokeping_api.RRDCACHED_SOCKET", "/run/rrdcached.sock"),
+            patch("smokeping_api._rrdcached_connect", return_value=(MagicMock(), reply)),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+        ):
+            result = get_target_data("test", "valid.rrd")
+
+            assert result["latency_ms"] is None
+            assert "rrdcached error" in result["error"]
+
+    def test_targets_pipelined_in_one_write(self) -> None:
+        """Test all uncached targets are requested with a single socket write."""
+        from smokeping_api import _CACHE, _read_targets
+
+        # "b" has a fresh cached reading and must not be requested again
+        _CACHE["b.rrd"] = (1000.0, 1735840200.0, {"latency_ms": 9.0, "loss_pct": 0.0}, b"")
+        sock = MagicMock()
+        with (
+            patch("smokeping_api.RRDCACHED_SOCKET", "/run/rrdcached.sock"),
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.time.monotonic", return_value=1010.0),
+            patch(
+                "smokeping_api._rrdcached_connect",
+                return_value=(sock, BytesIO(self.INFO_REPLY + b"-1 No such file\n" * 2)),
+            ),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.SMOKEPING_DATA_DIR", "/data"),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            results = _read_targets({"a": "a.rrd", "b": "b.rrd", "c": "c.rrd"})
+
+            mock_run.assert_not_called()
+            sock.sendall.assert_called_once_with(
+                b"FLUSH /data/a.rrd\nINFO /data/a.rrd\nFLUSH /data/c.rrd\nINFO /data/c.rrd\n"
+            )
+            assert list(results) == ["a", "b", "c"]
+            assert results["a"]["latency_ms"] == 15.0
+            assert results["b"]["latency_ms"] == 9.0
+            assert "rrdcached error" in results["c"]["error"]
+            assert _CACHE["a.rrd"][0] == 1010.0
+
+    def test_cached_reading_survives_hung_daemon(self) -> None:
+        """Test a fresh cached reading is served even if the pipelined read times out."""
+        import threading
+
+        from smokeping_api import _CACHE, _read_targets
+
+        _CACHE["b.rrd"] = (1000.0, 1735840200.0, {"latency_ms": 9.0, "loss_pct": 0.0}, b"")
+        release = threading.Event()
+        with (
+            patch("smokeping_api.RRDCACHED_SOCKET", "/run/rrdcached.sock"),
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api._RRD_TIMEOUT", -0.9),
+            patch("smokeping_api.time.monotonic", return_value=1010.0),
+            patch("smokeping_api._rrdcached_read", side_effect=lambda paths: release.wait(2)),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+        ):
+            results = _read_targets({"a": "a.rrd", "b": "b.rrd", "c": "c.rrd"})
+            release.set()
+
+        assert "timeout" in results["a"]["error"]
+        assert results["b"]["latency_ms"] == 9.0
+        assert "timeout" in results["c"]["error"]
+
+    def test_failed_pipeline_not_retried_per_target(self) -> None:
+        """Test targets fall back to rrdtool without asking the failed daemon again."""
+        from smokeping_api import _read_targets
+
+        with (
+            patch("smokeping_api.RRDCACHED_SOCKET", "/run/rrdcached.sock"),
+            patch("smokeping_api._rrdcached_read", return_value=None) as mock_read,
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout="uptime ping1 loss\n\n1735840200: 123456 1.50e-02 0",
+                stderr="",
+            )
+
+            results = _read_targets({"a": "a.rrd", "b": "b.rrd"})
+
+            mock_read.assert_called_once()
+            assert mock_run.call_count == 2
+            assert results["a"]["latency_ms"] == 15.0
+            assert results["b"]["latency_ms"] == 15.0
+
+    def test_fallback_shares_request_deadline(self) -> None:
+        """Test the fallback after a slow failed exchange only gets the time left."""
+        import threading
+
+        from smokeping_api import _read_targets
+
+        def slow_failure(paths: list[str]) -> None:
+            time.sleep(0.4)
+
+        release = threading.Event()
+        with (
+            patch("smokeping_api.RRDCACHED_SOCKET", "/run/rrdcached.sock"),
+            patch("smokeping_api._RRD_TIMEOUT", -0.5),
+            patch("smokeping_api._rrdcached_read", side_effect=slow_failure),
+            patch("smokeping_api._read_rrd", side_effect=lambda *args: release.wait(2)),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+        ):
+            started = time.monotonic()
+            results = _read_targets({"a": "a.rrd", "b": "b.rrd"})
+            elapsed = time.monotonic() - started
+            release.set()
+
+        # 0.5 s for the whole request, not 0.4 s plus a fresh 0.5 s for the fallback
+        assert elapsed < 0.8
+        assert "timeout" in results["a"]["error"]
+        assert "timeout" in results["b"]["error"]
+
+    def test_unreachable_daemon_falls_back_to_rrdtool(self) -> None:
+        """Test rrdtool CLI is used when the rrdcached socket can't be opened."""
+        from smokeping_api import _read_targets, get_target_data
+
+        with (
+            patch("smokeping_api.RRDCACHED_SOCKET", "/nonexistent/rrdcached.sock"),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout="uptime ping1 loss\n\n1735840200: 123456 1.50e-02 0",
+                stderr="",
+            )
+
+            result = get_target_data("test", "valid.rrd")
+
+            mock_run.assert_called_once()
+            assert result["latency_ms"] == 15.0
+
+            results = _read_targets({"a": "a.rrd", "b": "b.rrd"})
+
+            assert mock_run.call_count == 3
+            assert results["b"]["latency_ms"] == 15.0
+
+
+class TestRRDToolBindings:
+    """Tests for reading RRD data with the rrdtool Python bindings."""
+
+    @staticmethod
+    def _mock_bindings(ds: dict[str, Optional[float]]) -> MagicMock:
+        from datetime import datetime
+
+        bindings = MagicMock()
+        bindings.OperationalError = type("OperationalError", (Exception,), {})
+        bindings.lastupdate.return_value = {
+            "date": datetime.fromtimestamp(1735840200),
+            "ds": ds,
+        }
+        return bindings
+
+    def test_values_picked_by_name(self) -> None:
+        """Test pings and loss are read by data source name, not position."""
+        from smokeping_api import get_target_data
+
+        # SmokePing's real layout puts loss and median before the pings
+        bindings = self._mock_bindings(
+            {
+                "uptime": 123456.0,
+                "loss": 5.0,
+                "median": 0.5,
+                "ping1": 0.010,
+                "ping2": None,
+                "ping3": float("nan"),
+                "ping4": 0.020,
+            }
+        )
+        with (
+            patch("smokeping_api.rrdtool", bindings),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run") as mock_run,
+        ):
+            result = get_target_data("test", "valid.rrd")
+
+            mock_run.assert_not_called()
+            assert result["latency_ms"] == 15.0
+            assert result["loss_pct"] == 25.0
+            assert result["timestamp"] == "2025-01-02T17:50:00+00:00"
+
+    def test_unknown_loss(self) -> None:
+        """Test an unknown, NaN or infinite loss value gives loss_pct None."""
+        import smokeping_api
+        from smokeping_api import get_target_data
+
+        for loss in (None, float("nan"), float("inf")):
+            smokeping_api._CACHE.clear()
+            bindings = self._mock_bindings({"uptime": 1.0, "loss": loss, "ping1": 0.015})
+            with (
+                patch("smokeping_api.rrdtool", bindings),
+                patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+                patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            ):
+                result = get_target_data("test", "valid.rrd")
+
+                assert "error" not in result
+                assert result["latency_ms"] == 15.0
+                assert result["loss_pct"] is None
+
+    def test_librrd_error(self) -> None:
+        """Test librrd errors are reported without leaking details."""
+        from smokeping_api import get_target_data
+
+        bindings = self._mock_bindings({})
+        bindings.lastupdate.side_effect = bindings.OperationalError("opening '/x': No such file")
+        with (
+            patch("smokeping_api.rrdtool", bindings),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+        ):
+            result = get_target_data("test", "valid.rrd")
+
+            assert result["latency_ms"] is None
+            assert result["error"] == "rrdtool error reading file"
+
+
+class TestDataSourceOrder:
+    """Tests that every read path picks values by name in SmokePing's real DS order."""
+
+    # SmokePing creates "uptime loss median ping1 ... pingN"; 5 of 20 pings lost
+    DS = [
+        ("uptime", 123456.0),
+        ("loss", 5.0),
+        ("median", 0.5),
+        ("ping1", 0.010),
+        ("ping2", 0.020),
+        ("ping3", None),
+        ("ping4", 0.030),
+    ]
+    EXPECTED = {"latency_ms": 20.0, "loss_pct": 25.0, "timestamp": "2025-01-02T17:50:00+00:00"}
+
+    @staticmethod
+    def _text(value: Optional[float]) -> str:
+        return "U" if value is None else f"{value:g}"
+
+    def _read(self, **patches: Any) -> dict[str, Any]:
+        from smokeping_api import get_target_data
+
+        with (
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+            patch("smokeping_api.subprocess.run", **patches.pop("run", {})),
+        ):
+            if not patches:
+                return get_target_data("test", "valid.rrd")
+            with patch.multiple("smokeping_api", **patches):
+                return get_target_data("test", "valid.rrd")
+
+    def test_rrdtool_cli(self) -> None:
+        """Test the rrdtool CLI path."""
+        names = " ".join(name for name, _ in self.DS)
+        values = " ".join(self._text(value) for _, value in self.DS)
+        stdout = f" {names}\n\n1735840200: {values}\n"
+
+        result = self._read(run={"return_value": MagicMock(returncode=0, stdout=stdout)})
+
+        assert result == self.EXPECTED
+
+    def test_rrdtool_bindings(self) -> None:
+        """Test the rrdtool Python bindings path."""
+        bindings = TestRRDToolBindings._mock_bindings(dict(self.DS))
+
+        result = self._read(rrdtool=bindings)
+
+        assert result == self.EXPECTED
+
+    def test_rrdcached(self) -> None:
+        """Test the rrdcached path."""
+        reply = b"0 Flushed\n" + f"{len(self.DS) + 1} Info follows\n".encode()
+        reply += b"last_update 1 1735840200\n"
+        for name, value in self.DS:
+            reply += f"ds[{name}].last_ds 2 {self._text(value)}\n".encode()
+
+        result = self._read(
+            RRDCACHED_SOCKET="/run/rrdcached.sock",
+            _rrdcached_connect=MagicMock(return_value=(MagicMock(), BytesIO(reply))),
+        )
+
+        assert result == self.EXPECTED
+
+
+class TestGetAllTargetData:
+    """Tests for get_all_target_data function."""
+
+    @pytest.fixture(autouse=True)
+    def rrd_files(self) -> Any:
+        """Make every RRD path exist without touching the filesystem."""
+        with (
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api.SMOKEPING_DATA_DIR", "/data"),
+            patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
+        ):
+            yield
+
+    def test_targets_read_concurrently(self) -> None:
+        """Test that all targets are read in parallel."""
+        import threading
+
+        from smokeping_api import TARGETS, get_all_target_data
+
+        # Every read waits for all the others; a serial loop would break the barrier
+        barrier = threading.Barrier(len(TARGETS), timeout=2)
+
+        def fake_read_rrd(real_path: str, use_rrdcached: bool = True) -> dict[str, Any]:
+            barrier.wait()
+            return {"latency_ms": 1.0, "loss_pct": 0.0, "path": real_path}
+
+        with patch("smokeping_api._read_rrd", side_effect=fake_read_rrd):
+            results = get_all_target_data()
+
+        assert list(results) == list(TARGETS)
+        for target_name, rrd_path in TARGETS.items():
+            assert results[target_name]["path"].endswith(rrd_path)
+
+    def test_slow_target_times_out(self) -> None:
+        """Test that a hung read is reported as a timeout."""
+        import threading
+
+        from smokeping_api import get_all_target_data
+
+        release = threading.Event()
+
+        def fake_read_rrd(real_path: str, use_rrdcached: bool = True) -> dict[str, Any]:
+            if "google" in real_path:
+                release.wait(2)
+            return {"latency_ms": 1.0, "loss_pct": 0.0}
+
+        with (
+            patch("smokeping_api._RRD_TIMEOUT", -0.9),
+            patch("smokeping_api._read_rrd", side_effect=fake_read_rrd),
+        ):
+            results = get_all_target_data()
+            release.set()
+
+        assert results["google"]["latency_ms"] is None
+        assert "timeout" in results["google"]["error"]
+        assert results["cloudflare"]["latency_ms"] == 1.0
+
+    def test_queued_reads_cancelled_at_deadline(self) -> None:
+        """Test reads still queued on a busy pool are dropped, not run later."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from smokeping_api import _read_targets
+
+        release = threading.Event()
+        started: list[str] = []
+
+        def fake_read_rrd(real_path: str, use_rrdcached: bool = True) -> dict[str, Any]:
+            started.append(real_path)
+            release.wait(2)
+            return {"latency_ms": 1.0, "loss_pct": 0.0}
+
+        # A single busy worker: "b" can only start after "a" finishes
+        executor = ThreadPoolExecutor(max_workers=1)
+        with (
+            patch("smokeping_api._EXECUTOR", executor),
+            patch("smokeping_api._RRD_TIMEOUT", -0.9),
+            patch("smokeping_api._read_rrd", side_effect=fake_read_rrd),
+        ):
+            results = _read_targets({"a": "a.rrd", "b": "b.rrd"})
+            release.set()
+            executor.shutdown(wait=True)
+
+        assert "timeout" in results["a"]["error"]
+        assert "timeout" in results["b"]["error"]
+        assert started == ["/data/a.rrd"]
+
+    def test_cached_readings_served_while_pool_busy(self) -> None:
+        """Test fresh cached readings don't wait for a free pool thread."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from smokeping_api import _CACHE, TARGETS, get_all_target_data
+
+        for rrd_path in TARGETS.values():
+            _CACHE[rrd_path] = (1000.0, 1735840200.0, {"latency_ms": 9.0, "loss_pct": 0.0}, b"")
+
+        # Every worker is stuck on another client's read
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(release.wait, 2)
+        with (
+            patch("smokeping_api._EXECUTOR", executor),
+            patch("smokeping_api._RRD_TIMEOUT", -0.9),
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.time.monotonic", return_value=1010.0),
+        ):
+            results = get_all_target_data()
+            release.set()
+            executor.shutdown(wait=True)
+
+        for result in results.values():
+            assert "error" not in result
+            assert result["latency_ms"] == 9.0
+
+
 class MockRequest:
     """Mock HTTP request for testing handler."""
 
@@ -365,8 +1040,10 @@ class TestSmokePingAPIHandler:
 
         return SmokePingAPIHandler
 
-    def _make_request(self, handler_class: type, path: str) -> tuple[int, dict[str, Any]]:
-        """Helper to make a request and get response."""
+    def _make_raw_request(
+        self, handler_class: type, path: str
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Helper to make a request and get the status, headers and raw body."""
         # Capture the response
         response_buffer = BytesIO()
 
@@ -396,15 +1073,18 @@ class TestSmokePingAPIHandler:
         handler = TestHandler()
         handler.do_GET()
 
-        # Parse response
-        response_buffer.seek(0)
-        response_data = response_buffer.read().decode()
-
-        # Extract status code and body
-        parts = response_data.split("\r\n\r\n", 1)
-        status_line = parts[0].split("\r\n")[0]
+        # Split status line and headers from body
+        head, _, body = response_buffer.getvalue().partition(b"\r\n\r\n")
+        status_line, *header_lines = head.decode().split("\r\n")
         status_code = int(status_line.split()[1])
-        body = json.loads(parts[1]) if len(parts) > 1 and parts[1] else {}
+        headers = dict(line.split(": ", 1) for line in header_lines)
+
+        return status_code, headers, body
+
+    def _make_request(self, handler_class: type, path: str) -> tuple[int, dict[str, Any]]:
+        """Helper to make a request and get response."""
+        status_code, _, raw_body = self._make_raw_request(handler_class, path)
+        body = json.loads(raw_body) if raw_body else {}
 
         return status_code, body
 
@@ -420,7 +1100,7 @@ class TestSmokePingAPIHandler:
     def test_root_endpoint(self, handler_class: type) -> None:
         """Test / endpoint returns all targets."""
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run") as mock_run,
         ):
@@ -441,7 +1121,7 @@ class TestSmokePingAPIHandler:
     def test_metrics_endpoint_alias(self, handler_class: type) -> None:
         """Test /metrics endpoint works same as /."""
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run") as mock_run,
         ):
@@ -459,7 +1139,7 @@ class TestSmokePingAPIHandler:
     def test_valid_target_endpoint(self, handler_class: type) -> None:
         """Test /target/<name> endpoint for valid target."""
         with (
-            patch("smokeping_api.os.path.exists", return_value=True),
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
             patch("smokeping_api.os.path.realpath", side_effect=lambda p: p),
             patch("smokeping_api.subprocess.run") as mock_run,
         ):
@@ -476,6 +1156,42 @@ class TestSmokePingAPIHandler:
             assert body["target"] == "cloudflare"
             assert "isp" in body
 
+    def test_target_endpoint_reads_on_worker_pool(self, handler_class: type) -> None:
+        """Test single-target reads run on the shared reader threads."""
+        import threading
+
+        thread_names: list[str] = []
+
+        def fake_read_rrd(real_path: str, use_rrdcached: bool = True) -> dict[str, Any]:
+            thread_names.append(threading.current_thread().name)
+            return {"latency_ms": 1.0, "loss_pct": 0.0}
+
+        with (
+            patch("smokeping_api.os.stat", return_value=MagicMock(st_mtime=1735840200.0)),
+            patch("smokeping_api._read_rrd", side_effect=fake_read_rrd),
+        ):
+            status, body = self._make_request(handler_class, "/target/google")
+
+        assert status == 200
+        assert body["target"] == "google"
+        assert thread_names[0].startswith("rrd-reader")
+
+    def test_target_cache_hit_skips_worker_pool(self, handler_class: type) -> None:
+        """Test a cached single-target reading is served without a pool thread."""
+        from smokeping_api import _CACHE, TARGETS
+
+        _CACHE[TARGETS["google"]] = (1000.0, 1735840200.0, {"latency_ms": 9.0}, b"")
+        with (
+            patch("smokeping_api.CACHE_TTL", 30),
+            patch("smokeping_api.time.monotonic", return_value=1010.0),
+            patch("smokeping_api._EXECUTOR") as mock_executor,
+        ):
+            status, body = self._make_request(handler_class, "/target/google")
+
+        mock_executor.submit.assert_not_called()
+        assert status == 200
+        assert body["latency_ms"] == 9.0
+
     def test_invalid_target_endpoint(self, handler_class: type) -> None:
         """Test /target/<name> endpoint for invalid target returns 404."""
         status, body = self._make_request(handler_class, "/target/nonexistent")
@@ -570,6 +1286,166 @@ class TestSmokePingAPIHandler:
         assert "Access-Control-Allow-Methods" in header_dict
         assert "GET" in header_dict["Access-Control-Allow-Methods"]
         assert "OPTIONS" in header_dict["Access-Control-Allow-Methods"]
+        # RFC 9110 forbids Content-Length on a 204
+        assert "Content-Length" not in header_dict
+
+    def test_compact_json_with_content_length(self, handler_class: type) -> None:
+        """Test responses are compact JSON with a matching Content-Length."""
+        status, headers, body = self._make_raw_request(handler_class, "/health")
+
+        assert status == 200
+        assert b"\n" not in body
+        assert b'", "' not in body
+        assert headers["Content-Length"] == str(len(body))
+        assert json.loads(body)["status"] == "ok"
+
+    def test_pretty_query_indents_json(self, handler_class: type) -> None:
+        """Test ?pretty=1 returns indented JSON and still routes the path."""
+        status, headers, body = self._make_raw_request(handler_class, "/health?pretty=1")
+
+        assert status == 200
+        assert b'\n  "status": "ok"' in body
+        assert headers["Content-Length"] == str(len(body))
+
+        status, _, body = self._make_raw_request(handler_class, "/nope?pretty=1")
+
+        assert status == 404
+        assert b'\n  "error": "Not found"' in body
+
+        _, _, body = self._make_raw_request(handler_class, "/nope")
+
+        assert body.startswith(b'{"error":"Not found"')
+
+    def test_root_spliced_json_matches_full_encoding(self, handler_class: type) -> None:
+        """Test the pre-encoded / response equals encoding the whole document."""
+        import smokeping_api
+
+        targets = {"cloudflare": {"latency_ms": 1.5, "loss_pct": 0.0}}
+        with (
+            patch("smokeping_api.get_all_target_data", return_value=targets),
+            patch("smokeping_api.time.time", return_value=1735840200.4),
+        ):
+            status, _, body = self._make_raw_request(handler_class, "/")
+            _, _, pretty_body = self._make_raw_request(handler_class, "/?pretty=1")
+
+        expected = {
+            "targets": targets,
+            "isp": smokeping_api.ISP,
+            "hostname": smokeping_api.HOSTNAME,
+            "collected_at": "2025-01-02T17:50:00+00:00",
+        }
+        assert status == 200
+        assert body == smokeping_api._dumps(expected)
+        assert pretty_body == smokeping_api._dumps(expected, pretty=True)
+
+    def test_root_reuses_cached_target_encoding(self, handler_class: type) -> None:
+        """Test cached readings are spliced into / without being encoded again."""
+        import smokeping_api
+
+        reading = {"latency_ms": 1.5, "loss_pct": 0.0}
+        for rrd_path in smokeping_api.TARGETS.values():
+            smokeping_api._CACHE[rrd_path] = (time.monotonic(), 0.0, reading, b'"pre-encoded"')
+
+        with patch("smokeping_api.CACHE_TTL", 30):
+            status, _, body = self._make_raw_request(handler_class, "/")
+
+        assert status == 200
+        assert json.loads(body)["targets"] == dict.fromkeys(smokeping_api.TARGETS, "pre-encoded")
+
+    def test_dumps_without_orjson(self) -> None:
+        """Test the stdlib json fallback produces the same documents."""
+        from smokeping_api import _dumps
+
+        data = {"a": [1, 2.5, None], "b": "x"}
+        with patch("smokeping_api.orjson", None):
+            assert _dumps(data) == b'{"a":[1,2.5,null],"b":"x"}'
+            assert _dumps(data, pretty=True) == json.dumps(data, indent=2).encode()
+
+    def test_keep_alive_reuses_connection(self, handler_class: type) -> None:
+        """Test several requests are served over one HTTP/1.1 connection."""
+        import http.client
+        import threading
+        from http.server import ThreadingHTTPServer
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+            conn.request("GET", "/health")
+            first = conn.getresponse()
+            assert first.status == 200
+            assert json.loads(first.read())["status"] == "ok"
+            sock = conn.sock
+
+            conn.request("OPTIONS", "/")
+            second = conn.getresponse()
+            second.read()
+            assert second.status == 204
+            assert conn.sock is sock  # Connection was not reopened
+            conn.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_idle_connection_closed(self) -> None:
+        """Test a kept-alive connection is closed once it has been idle too long."""
+        import socket
+        import threading
+        from http.server import ThreadingHTTPServer
+
+        from smokeping_api import SmokePingAPIHandler
+
+        assert SmokePingAPIHandler.timeout == 60
+
+        with patch.object(SmokePingAPIHandler, "timeout", 0.2):
+            server = ThreadingHTTPServer(("127.0.0.1", 0), SmokePingAPIHandler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                with socket.create_connection(
+                    ("127.0.0.1", server.server_address[1]), timeout=5
+                ) as client:
+                    client.sendall(b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n")
+                    response = b""
+                    while chunk := client.recv(4096):
+                        response += chunk
+
+                    # The read above only ends once the server closes the socket
+                    assert response.startswith(b"HTTP/1.1 200")
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def test_response_sent_in_one_write(self, handler_class: type) -> None:
+        """Test headers and body of a response go out in a single socket send."""
+        import socket
+
+        sends: list[bytes] = []
+
+        class CountingSocket(socket.socket):
+            def send(self, data: Any, flags: int = 0) -> int:
+                sends.append(bytes(data))
+                return super().send(data, flags)
+
+            def sendall(self, data: Any, flags: int = 0) -> None:
+                sends.append(bytes(data))
+                super().sendall(data, flags)
+
+        with socket.create_server(("127.0.0.1", 0)) as listener:
+            client = socket.create_connection(listener.getsockname())
+            conn, addr = listener.accept()
+            server_side = CountingSocket(fileno=conn.detach())
+            try:
+                client.sendall(b"GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+                handler_class(server_side, addr, MagicMock())
+            finally:
+                server_side.close()
+                client.close()
+
+        assert len(sends) == 1
+        assert sends[0].startswith(b"HTTP/1.1 200")
+        assert b'\r\n\r\n{"status":"ok"' in sends[0]  # Body follows headers in the same send
 
     def test_target_with_hyphen_in_name(self, handler_class: type) -> None:
         """Test that target names with hyphens are accepted."""
@@ -582,6 +1458,100 @@ class TestSmokePingAPIHandler:
         assert "available" in body  # Shows it matched the route
 
 
+class TestMain:
+    """Tests for server startup."""
+
+    def test_serves_with_threading_server(self) -> None:
+        """Test that the server handles each connection in its own thread."""
+        import smokeping_api
+
+        with (
+            patch("smokeping_api.ThreadingHTTPServer") as mock_server_class,
+            patch("builtins.print"),
+        ):
+            mock_server_class.return_value.serve_forever.side_effect = KeyboardInterrupt
+            smokeping_api.main()
+
+            mock_server_class.assert_called_once_with(
+                (smokeping_api.BIND_ADDRESS, smokeping_api.PORT),
+                smokeping_api.SmokePingAPIHandler,
+            )
+            mock_server_class.return_value.shutdown.assert_called_once()
+
+
+class TestNicPinning:
+    """Tests for pinning the server to a network interface's NUMA node."""
+
+    @staticmethod
+    def _make_sysfs(root: Path, numa_node: str, cpulist: str = "0-3,8-11") -> str:
+        device = root / "class" / "net" / "eth0" / "device"
+        device.mkdir(parents=True)
+        (device / "numa_node").write_text(f"{numa_node}\n")
+        node = root / "devices" / "system" / "node" / "node1"
+        node.mkdir(parents=True)
+        (node / "cpulist").write_text(f"{cpulist}\n")
+        return str(root)
+
+    def test_parse_cpulist(self) -> None:
+        """Test CPU lists with single CPUs and ranges."""
+        from smokeping_api import _parse_cpulist
+
+        assert _parse_cpulist("0-3,8-9\n") == {0, 1, 2, 3, 8, 9}
+        assert _parse_cpulist("5") == {5}
+        assert _parse_cpulist("") == set()
+
+    def test_nic_cpus(self, tmp_path: Path) -> None:
+        """Test the CPUs of the interface's NUMA node are found."""
+        from smokeping_api import _nic_cpus
+
+        sysfs = self._make_sysfs(tmp_path, "1")
+
+        assert _nic_cpus("eth0", sysfs) == {0, 1, 2, 3, 8, 9, 10, 11}
+
+    def test_nic_cpus_unknown(self, tmp_path: Path) -> None:
+        """Test missing interfaces, no NUMA node and bad names give no CPUs."""
+        from smokeping_api import _nic_cpus
+
+        sysfs = self._make_sysfs(tmp_path, "-1")
+
+        assert _nic_cpus("eth0", sysfs) == set()
+        assert _nic_cpus("wlan9", sysfs) == set()
+        assert _nic_cpus("../eth0", sysfs) == set()
+
+    def test_main_pins_when_configured(self) -> None:
+        """Test main() pins to the interface's CPUs before starting the server."""
+        import smokeping_api
+
+        with (
+            patch("smokeping_api.PIN_NIC", "eth0"),
+            patch("smokeping_api._nic_cpus", return_value={0, 1, 2, 3}),
+            patch("smokeping_api.os.sched_getaffinity", return_value={2, 3, 4}),
+            patch("smokeping_api.os.sched_setaffinity") as mock_setaffinity,
+            patch("smokeping_api.ThreadingHTTPServer") as mock_server_class,
+            patch("builtins.print"),
+        ):
+            mock_server_class.return_value.serve_forever.side_effect = KeyboardInterrupt
+            smokeping_api.main()
+
+            mock_setaffinity.assert_called_once_with(0, {2, 3})
+
+    def test_no_pinning_without_numa_info(self) -> None:
+        """Test affinity is left alone when the interface's CPUs are unknown."""
+        from io import StringIO
+
+        from smokeping_api import _pin_to_nic
+
+        with (
+            patch("smokeping_api._nic_cpus", return_value=set()),
+            patch("smokeping_api.os.sched_setaffinity") as mock_setaffinity,
+            patch("sys.stderr", new_callable=StringIO) as mock_stderr,
+        ):
+            _pin_to_nic("eth0")
+
+            mock_setaffinity.assert_not_called()
+            assert "not pinning" in mock_stderr.getvalue()
+
+
 class TestConfiguration:
     """Tests for configuration via environment variables."""
 
@@ -693,6 +1663,16 @@ class TestConfiguration:
             assert smokeping_api.PORT == 8080
             assert "below minimum" in mock_stderr.getvalue()
 
+    def test_cache_ttl_from_env(self) -> None:
+        """Test cache TTL can be set via environment variable, including 0."""
+        import importlib
+
+        with patch.dict(os.environ, {"SMOKEPING_API_CACHE_TTL": "0"}):
+            import smokeping_api
+
+            importlib.reload(smokeping_api)
+            assert smokeping_api.CACHE_TTL == 0
+
     def test_invalid_total_pings_uses_default(self) -> None:
         """Test that invalid TOTAL_PINGS value falls back to default."""
         import importlib